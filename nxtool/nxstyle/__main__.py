@@ -1,50 +1,120 @@
 import sys
+import os
+import io
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import argparse
 from nxtool.nxstyle.nxstyle import Checker, CChecker
 
-argparser: argparse.ArgumentParser = argparse.ArgumentParser(
-    prog = "nxstyle",
-    description = "My CLI tool"
-)
-
-argparser.add_argument(
-    "-n",
-    "--non-nuttx",
-    action = "store_false",
-    dest = "nuttx_codebase",
-    help = "disable checks that are not relevant for non-nuttx codebase"
-)
-
-argparser.add_argument(
-    "file",
-    type = Path,
-    help = "File to check"
-)
-
-args = argparser.parse_args()
-
-file_path: Path = Path(args.file)
-
-if not file_path.resolve().is_file():
-    print("Not a valid file path")
-    sys.exit(1)
-
-checker: Checker | None = None
-
-match file_path.suffix:
-    case '.c':
-        checker = CChecker(
-            file_path,
-            'c.scm',
-            nuttx_codebase = args.nuttx_codebase
+def make_checker(file_path: Path, nuttx_codebase: bool) -> Checker | None:
+    """
+    Create the checker matching the file type.
+
+    :param file_path: File to check
+    :type file_path: Path
+    :param nuttx_codebase: Enable nuttx specific checks
+    :type nuttx_codebase: bool
+    :return: Checker instance, None if the file type has no checker yet
+    :rtype: Checker | None
+    """
+    match file_path.suffix:
+        case '.c':
+            return CChecker(
+                file_path,
+                'c.scm',
+                nuttx_codebase = nuttx_codebase
+            )
+        case _:
+            return None
+
+def check_file(file_path: Path, nuttx_codebase: bool) -> str:
+    """
+    Check a single file and return its diagnostics.
+    Runs in worker processes, diagnostics are returned so that the parent
+    can print them in the same order the files were given.
+
+    :param file_path: File to check
+    :type file_path: Path
+    :param nuttx_codebase: Enable nuttx specific checks
+    :type nuttx_codebase: bool
+    :return: Checker output
+    :rtype: str
+    """
+    checker: Checker | None = make_checker(file_path, nuttx_codebase)
+
+    if checker is None:
+        return ""
+
+    out: io.StringIO = io.StringIO()
+    checker.check_style(out)
+
+    return out.getvalue()
+
+def main() -> None:
+    """
+    nxstyle command entry point
+    """
+    argparser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog = "nxstyle",
+        description = "My CLI tool"
+    )
+
+    argparser.add_argument(
+        "-n",
+        "--non-nuttx",
+        action = "store_false",
+        dest = "nuttx_codebase",
+        help = "disable checks that are not relevant for non-nuttx codebase"
+    )
+
+    argparser.add_argument(
+        "file",
+        type = Path,
+        nargs = '+',
+        help = "Files to check"
+    )
+
+    args = argparser.parse_args()
+
+    # Bad arguments are reported and skipped, the remaining files still get checked
+    file_paths: list[Path] = []
+    status: int = 0
+
+    for file_path in args.file:
+        if not file_path.is_file():
+            print(f"{file_path}: not a valid file path", file = sys.stderr)
+            status = 1
+        elif file_path.suffix not in ('.c', '.h'):
+            print(f"{file_path}: unsupported file type", file = sys.stderr)
+            status = 1
+        else:
+            file_paths.append(file_path)
+
+    if len(file_paths) == 0:
+        sys.exit(status)
+
+    if len(file_paths) == 1:
+        checker: Checker | None = make_checker(file_paths[0], args.nuttx_codebase)
+        if checker is not None:
+            checker.check_style()
+        sys.exit(status)
+
+    # Files are independent, checks are pure python so use processes.
+    # Grammar and compiled queries are module level and built once per worker
+    workers: int = min(len(file_paths), os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        results = executor.map(
+            check_file,
+            file_paths,
+            [args.nuttx_codebase] * len(file_paths)
         )
-    case '.h':
-        pass
-    case _:
-        sys.exit(1)
 
-if checker is not None:
-    checker.check_style()
+        for result in results:
+            sys.stdout.write(result)
+
+    sys.exit(status)
 
-sys.exit(0)
\ No newline at end of file
+# Spawned worker processes import this module, only run the command when executed
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,73 @@ from pathlib import Path
 import sys
 import importlib.resources
 import re
+import array
+
+from bisect import bisect_left
 
 from abc import ABC, abstractmethod
-from typing import Generator
+from typing import Generator, TextIO
 
 from tree_sitter import Language, Parser, Tree, Node, Point, Query
 from tree_sitter_language_pack import get_language, get_parser
 
+# Compiled queries never change for a given language / query file,
+# so compile them once per process instead of once per checker.
+_QUERY_CACHE: dict[tuple[int, str], Query] = {}
+
+# Grammar loading is also a one time cost, shared by all c checkers.
+_C_LANGUAGE: Language = get_language('c')
+_C_PARSER: Parser = get_parser('c')
+
+# Patterns used by the checkers, compiled once at import time.
+# Node text is bytes, patterns are bytes as well to avoid decoding it
+_RE_WS_ALL: re.Pattern[bytes] = re.compile(
+    rb"(?P<ws_lparen>\((?=\s))"
+    rb"|(?P<ws_rparen>\s(?=\)))"
+    rb"|(?P<op>\|\||&&|<<=|>>=|[+\*\/%&|^<>!=]=)"
+    rb"|(?P<comma>,(?!\s))"
+)
+_RE_STRIP_STR: re.Pattern[bytes] = re.compile(rb"([\"\'].*?\")")
+_RE_PTR_NOWS: re.Pattern[bytes] = re.compile(rb"(?<!\s)\*")
+_RE_NEWLINE: re.Pattern[bytes] = re.compile(rb"\n")
+
+def _blank_string(m: re.Match[bytes]) -> bytes:
+    """
+    Replacement for _RE_STRIP_STR matches, same length as the literal.
+    """
+    literal: bytes = m.group(0)
+    return literal[:1] + b"x" * (len(literal) - 2) + literal[-1:]
+
+# NuttX pointer qualifiers, plain substring tests are enough for these
+_QUALS: tuple[bytes, ...] = (b"FAR", b"NEAR", b"DSEG", b"CODE")
+
+# Node types whose named children are checked one indent level deeper
+_INDENT_RECURSE: frozenset[str] = frozenset({
+    "return_statement",
+    "expression_statement",
+    "declaration",
+    "break_statement",
+    "field_declaration",
+    "enumerator",
+})
+
+# Statements whose condition is a paranthesized expression after a keyword
+_LOOP_PARENTS: frozenset[str] = frozenset({
+    "if_statement",
+    "for_statement",
+    "while_statement",
+    "do_statement",
+    "switch_statement",
+})
+
+# Rules reported from a _RE_WS_ALL scan, in reporting order
+_WS_RULES: tuple[tuple[str, str], ...] = (
+    ("ws_lparen", "Whitespace after open paranthesis"),
+    ("ws_rparen", "Whitespace before close paranthesis"),
+    ("op_before", "Missing whitespaces before operator"),
+    ("op_after", "Missing whitespaces after operator"),
+    ("comma", "Missing whitespaces after comma"),
+)
 
 class Checker(ABC):
     """
@@ -34,12 +94,26 @@ class Checker(ABC):
         self.parser: Parser = parser
         self.lang: Language = lang
 
-        try:
-            with importlib.resources.open_text("nxtool.nxstyle.queries", scm) as f:
-                queries: Query = self.lang.query(f.read())
-        except FileNotFoundError as e:
-            print(f"{e}")
-            sys.exit(1)
+        # Resolve the path once, diagnostics only fill in the location and text.
+        # The path is never used as a format string, it may hold braces
+        self._resolved: str = str(file.resolve())
+
+        # Diagnostics are buffered as (row, column, message)
+        # and written at once by flush_diagnostics
+        self._diag: list[tuple[int, int, str]] = []
+
+        key: tuple[int, str] = (id(self.lang), scm)
+        queries: Query | None = _QUERY_CACHE.get(key)
+
+        if queries is None:
+            try:
+                with importlib.resources.open_text("nxtool.nxstyle.queries", scm) as f:
+                    queries = Query(self.lang, f.read())
+            except FileNotFoundError as e:
+                print(f"{e}")
+                sys.exit(1)
+
+            _QUERY_CACHE[key] = queries
 
         self.captures = queries.captures(self.tree.root_node)
 
@@ -71,33 +145,112 @@ class Checker(ABC):
             elif not cursor.goto_parent():
                 break
 
+    def walk_children(self, node: Node) -> Generator[Node, None, None]:
+        """
+        Helper function to iterate over the direct children of a node using a cursor.
+        Each child is visited once, avoiding repeated random access
+        (children[i], prev_sibling)
+
+        :param node: The parent node
+        :type node: Node
+        :yield: Child nodes
+        :rtype: Generator[Node, None, None]
+        """
+        cursor = node.walk()
+
+        if not cursor.goto_first_child():
+            return
+
+        while True:
+            child: Node | None = cursor.node
+            if child is not None:
+                yield child
+            if not cursor.goto_next_sibling():
+                break
+
+    def child_fields(self, node: Node) -> dict[str, tuple[Node, Node | None]]:
+        """
+        Collect the field children of a node in a single walk_children pass.
+
+        :param node: The parent node
+        :type node: Node
+        :return: Mapping of field name to (child, previous sibling)
+        :rtype: dict[str, tuple[Node, Node | None]]
+        """
+        fields: dict[str, tuple[Node, Node | None]] = {}
+        prev: Node | None = None
+
+        for i, child in enumerate(self.walk_children(node)):
+            field: str | None = node.field_name_for_child(i)
+
+            if field is not None and field not in fields:
+                fields[field] = (child, prev)
+
+            prev = child
+
+        return fields
+
     def info(self, point: Point, text: str) -> str:
-        return (
-            f"{self.file.resolve()}:{point.row + 1}:{point.column}: "
-            f"[INFO] "
-            f"{text}")
+        return self._message(point, "INFO", text)
 
     def warning(self, point: Point, text: str) -> str:
-        return (
-            f"{self.file.resolve()}:{point.row + 1}:{point.column}: "
-            f"[WARNING] "
-            f"{text}")
+        return self._message(point, "WARNING", text)
 
     def error(self, point: Point, text: str) -> str:
-        return (
-            f"{self.file.resolve()}:{point.row + 1}:{point.column}: "
-            f"[ERROR] "
-            f"{text}")
+        return self._message(point, "ERROR", text)
 
-    def style_assert(self, check: bool, message: str) -> None:
+    def _message(self, point: Point, level: str, text: str) -> str:
+        return f"{self._resolved}:{point.row + 1}:{point.column}: [{level}] {text}"
+
+    def style_assert(self, check: bool, point: Point, level: str, text: str, *args) -> None:
+        """
+        Record a diagnostic if check holds.
+        The message is only formatted for violations, passing checks
+        cost nothing more than evaluating the condition.
+
+        :param check: True if the style rule is violated
+        :type check: bool
+        :param point: Location reported for the violation
+        :type point: Point
+        :param level: One of "INFO", "WARNING" or "ERROR"
+        :type level: str
+        :param text: Message, formatted with args when given
+        :type text: str
+        """
         if check is True:
-            print(message)
+            if args:
+                text = text.format(*args)
+
+            self._diag.append((
+                point.row,
+                point.column,
+                self._message(point, level, text)
+            ))
+
+    def flush_diagnostics(self, out: TextIO | None = None) -> None:
+        """
+        Write all buffered diagnostics, ordered by location.
+
+        :param out: Stream to write to, stdout when not given
+        :type out: TextIO | None
+        """
+        if not self._diag:
+            return
+
+        stream: TextIO = sys.stdout if out is None else out
+
+        self._diag.sort(key=lambda d: (d[0], d[1]))
+        stream.write("\n".join(d[2] for d in self._diag) + "\n")
+        self._diag.clear()
 
     @abstractmethod
-    def check_style(self) -> None:
+    def check_style(self, out: TextIO | None = None) -> None:
         """
         Entry point for each checker.
         This method should hold custom logic of checking files
+
+        :param out: Stream diagnostics are written to, stdout when not given
+        :type out: TextIO | None
         """
 
 class CChecker(Checker):
@@ -116,56 +269,76 @@ class CChecker(Checker):
         
         self.nuttx_codebase: bool = kwargs.get("nuttx_codebase", True)
 
-        lang = get_language('c')
-        parser = get_parser('c')
-        tree = parser.parse(src)
-
-        super().__init__(file, tree, parser, lang, scm)
-
-    def check_style(self) -> None:
-        if "function.body" in self.captures:
-            for m in self.captures["function.body"]:
-                for n in iter(m.named_children):
-                    self.__check_indents(2, n)
-
-        if "expression.paranthesis" in self.captures:
-            for m in self.captures["expression.paranthesis"]:
-                if m.parent is not None and m.parent.type in {
-                    "if_statement",
-                    "for_statement",
-                    "while_statement",
-                    "do_statement",
-                    "switch_statement",
-                }:
-
-                    if m.prev_sibling is None:
-                        continue
-                        
-                    self.style_assert(
-                        (m.start_point.column - m.prev_sibling.end_point.column) != 1,
-                        self.error(
-                            m.start_point, 
-                            "There should be exacly one whitespace after keyword"
-                        )
-                    )
-
-                self.__check_whitespaces(m)
-
-        if "list.arguments" in self.captures:
-            for m in self.captures["list.arguments"]:
-                self.__check_whitespaces(m)
-                
-        if "structs" in self.captures:
-            for m in self.captures["structs"]:
-                self.__check_structs(m)
-                
-        if "enums" in self.captures:
-            for m in self.captures["enums"]:
-                self.__check_enums(m)
+        self._src: bytes = src
+
+        # Byte offsets of every newline, built by _point_at on first use
+        self._nl_offsets: array.array | None = None
+
+        # Without any qualifier keyword in the file the per node search can't match
+        self._has_far_quals: bool = any(q in src for q in _QUALS)
+
+        tree = _C_PARSER.parse(src)
+
+        super().__init__(file, tree, _C_PARSER, _C_LANGUAGE, scm)
+
+    def _point_at(self, offset: int) -> Point:
+        """
+        Map a byte offset in the source file to its row and column.
+
+        :param offset: Byte offset from the start of the file
+        :type offset: int
+        :return: Location of the offset, zero based like tree-sitter points
+        :rtype: Point
+        """
+        nl_offsets: array.array | None = self._nl_offsets
+
+        # Only violations need the index, clean files never build it.
+        # A -1 sentinel stands for the start of the first row
+        if nl_offsets is None:
+            nl_offsets = array.array('i', [-1])
+            nl_offsets.extend(m.start() for m in _RE_NEWLINE.finditer(self._src))
+            self._nl_offsets = nl_offsets
+
+        row: int = bisect_left(nl_offsets, offset) - 1
+        return Point(row, offset - nl_offsets[row] - 1)
+
+    def check_style(self, out: TextIO | None = None) -> None:
+        for capture, handler in self._CAPTURE_HANDLERS:
+            nodes: list[Node] | None = self.captures.get(capture)
+
+            if not nodes:
+                continue
+
+            for m in nodes:
+                handler(self, m)
+
+        self.flush_diagnostics(out)
+
+    def __check_function_body(self, node: Node) -> None:
+        for n in self.walk_children(node):
+            if n.type in self._INDENT_CHECKED:
+                self.__check_indents(2, n)
+
+    def __check_paranthesis(self, node: Node) -> None:
+        parent: Node | None = node.parent
+
+        if parent is not None and parent.type in _LOOP_PARENTS:
+
+            keyword: Node | None = node.prev_sibling
+
+            if keyword is None:
+                return
+
+            sp: Point = node.start_point
+
+            self.style_assert(
+                (sp.column - keyword.end_point.column) != 1,
+                sp,
+                "ERROR",
+                "There should be exacly one whitespace after keyword"
+            )
 
-        if "declarator.pointer" in self.captures:
-            for m in self.captures["declarator.pointer"]:
-                self.__check_pointer_declarator(m)
+        self.__check_whitespaces(node)
 
     def __check_indents(self, indent: int, node: Node):
         """
@@ -179,33 +352,27 @@ class CChecker(Checker):
         :param node:
         :type node: Node 
         """
-        match node.type:
-            case "if_statement" | "else_clause":
-                self.__check_indents_if_statement(indent, node)
-            case "for_statement":
-                self.__check_indents_for_statement(indent, node)
-            case "while_statement" | "do_statement":
-                self.__check_indents_while_statement(indent, node)
-            case "switch_statement":
-                self.__check_indents_switch_statement(indent, node)
-            case (
-                "return_statement" |
-                "expression_statement" |
-                "declaration" | 
-                "break_statement" |
-                "field_declaration" |
-                "enumerator"
-            ):
-                for child in node.named_children:
+        node_type: str = node.type
+        handler = self._INDENT_DISPATCH.get(node_type)
+
+        if handler is not None:
+            handler(self, indent, node)
+        elif node_type in _INDENT_RECURSE:
+            for child in self.walk_children(node):
+                if child.type in self._INDENT_CHECKED:
                     self.__check_indents(indent + 2, child)
-            case _:
-                return
+        else:
+            return
+
+        sp: Point = node.start_point
+
         self.style_assert(
-            node.start_point.column != indent,
-            self.error(
-                node.start_point, 
-                f"Wrong indentation [Expected: {indent} / Actual: {node.start_point.column}]"
-            )
+            sp.column != indent,
+            sp,
+            "ERROR",
+            "Wrong indentation [Expected: {} / Actual: {}]",
+            indent,
+            sp.column
         )
         
     def __check_body(self, indent: int, node: Node) -> None:
@@ -220,38 +387,69 @@ class CChecker(Checker):
         
         if node.type == "expression_statement":
             self.__check_indents(indent, node)
+
+        # Single forward pass, remember the first two and the last two children
+        first: Node | None = None
+        second: Node | None = None
+        penult: Node | None = None
+        last: Node | None = None
+        nested: list[Node] = []
+
+        for child in self.walk_children(node):
+            if first is None:
+                first = child
+            elif second is None:
+                second = child
+            penult, last = last, child
+            if child.type in self._INDENT_CHECKED:
+                nested.append(child)
+
+        # Bracket checks need an opening and a closing child,
+        # skip bodies with fewer than two children (e.g. a lone ";")
+        if first is None or second is None or penult is None or last is None:
+            return
+
+        sp: Point = node.start_point
+        first_sp: Point = first.start_point
+        last_sp: Point = last.start_point
         
         # Open braket should be on separate line
         self.style_assert(
-            node.children[0].start_point.row == node.children[1].start_point.row,
-            self.error(node.start_point, "Left bracket not on separate line")
+            first_sp.row == second.start_point.row,
+            sp,
+            "ERROR",
+            "Left bracket not on separate line"
         )
 
         # Open braket should be indented by two whitespaces
         self.style_assert(
-            node.children[0].start_point.column != indent,
-            self.error(
-                node.start_point,
-                f"Wrong indentation [Expected: {indent} / Actual: {node.children[0].start_point.column}]"
-            )
+            first_sp.column != indent,
+            sp,
+            "ERROR",
+            "Wrong indentation [Expected: {} / Actual: {}]",
+            indent,
+            first_sp.column
         )
 
-        for n in node.named_children:
+        for n in nested:
             self.__check_indents(indent + 2, n)
 
         # Close braket should be on separate line
         self.style_assert(
-            node.children[-1].start_point.row == node.children[-2].start_point.row,
-            self.error(node.start_point, "Right bracket not on separate line")
+            last_sp.row == penult.start_point.row,
+            sp,
+            "ERROR",
+            "Right bracket not on separate line"
         )
 
         # Close braket should be indented by two whitespaces
         self.style_assert(
-            node.children[-1].start_point.column != indent,
-            self.error(
-                node.children[-1].start_point,
-                f"Wrong indentation [Expected: {indent} / Actual: {node.children[-1].start_point.column}]"
-            )
+            last_sp.column != indent,
+            last_sp,
+            "ERROR",
+            "Wrong indentation [Expected: {} / Actual: {}]",
+            indent,
+            last_sp.column
         )
 
     def __check_indents_if_statement(self, indent: int, node: Node) -> None:
@@ -267,7 +465,11 @@ class CChecker(Checker):
         if node.type == "else_clause":
 
             # Second child should be a if_statement
-            second_child: Node = node.children[1]
+            second_child: Node | None = node.child(1)
+
+            # Incomplete else_clause (parse error), nothing to check
+            if second_child is None:
+                return
 
             # else_clause body can also be a compone_statement or expression_statement
             if second_child.type != "if_statement":
@@ -275,31 +477,36 @@ class CChecker(Checker):
                 return                
 
             else:
+                second_sp: Point = second_child.start_point
+
                 # If keyword should be inlined with else keyword
                 self.style_assert(
-                    second_child.start_point.row != node.start_point.row,
-                    self.error(
-                        second_child.start_point,
-                        "If keyword not inlined with else keyword"
-                    )
+                    second_sp.row != node.start_point.row,
+                    second_sp,
+                    "ERROR",
+                    "If keyword not inlined with else keyword"
                 )
                 
                 node = second_child
 
-        consequence: Node | None = node.child_by_field_name("consequence")
-        alternative: Node | None = node.child_by_field_name("alternative")
+        fields = self.child_fields(node)
 
-        if consequence is not None:
+        if "consequence" in fields:
+            consequence, _ = fields["consequence"]
+            consequence_sp: Point = consequence.start_point
         
             # Open braket should be on separate line
             self.style_assert(
-                consequence.start_point.row == node.start_point.row,
-                self.error(consequence.start_point, "Left bracket not on separate line")
+                consequence_sp.row == node.start_point.row,
+                consequence_sp,
+                "ERROR",
+                "Left bracket not on separate line"
             )
             
             self.__check_body(indent + 2, consequence)
     
-        if alternative is not None:
+        if "alternative" in fields:
+            alternative, _ = fields["alternative"]
             
             # Do not check directly, call __ckeck_indents
             # __check_if_statement will get called recuresively
@@ -308,22 +515,29 @@ class CChecker(Checker):
 
     def  __check_indents_for_statement(self, indent: int, node: Node) -> None:
 
-        body: Node | None = node.child_by_field_name("body")
+        fields = self.child_fields(node)
         
         # TODO: rework sanity checks
-        if body is None:
+        if "body" not in fields:
             return
+
+        body, prev = fields["body"]
         
         # TODO: rework sanity checks
-        if body.prev_sibling is None:
+        if prev is None:
             return
 
+        body_sp: Point = body.start_point
+        prev_row: int = prev.start_point.row
+
         if body.type == "compound_statement":
 
             # Open braket should be on separate line
             self.style_assert(
-                body.start_point.row == body.prev_sibling.start_point.row,
-                self.error(body.start_point, "Left bracket not on separate line")
+                body_sp.row == prev_row,
+                body_sp,
+                "ERROR",
+                "Left bracket not on separate line"
             )
             
             self.__check_body(indent + 2, body)
@@ -332,215 +546,338 @@ class CChecker(Checker):
 
             if body.named_child_count == 0:
                 self.style_assert(
-                    body.prev_sibling.start_point.row != body.start_point.row,
-                    self.error(body.start_point, "Empty body should be inline with last node")
+                    prev_row != body_sp.row,
+                    body_sp,
+                    "ERROR",
+                    "Empty body should be inline with last node"
                 )
 
             else:
-                for n in body.named_children:
-                    self.__check_indents(indent + 4, n)
+                for n in self.walk_children(body):
+                    if n.type in self._INDENT_CHECKED:
+                        self.__check_indents(indent + 4, n)
 
     def __check_indents_while_statement(self, indent: int, node: Node) -> None:
 
-        body: Node | None = node.child_by_field_name("body")
+        fields = self.child_fields(node)
         
         # TODO: rework sanity checks
-        if body is None:
+        if "body" not in fields:
             return
 
+        body, prev = fields["body"]
+
         # TODO: rework sanity checks
-        if body.prev_sibling is None:
+        if prev is None:
             return
 
+        body_sp: Point = body.start_point
+
         # Open braket should be on separate line
         self.style_assert(
-            body.start_point.row == body.prev_sibling.start_point.row,
-            self.error(body.start_point, "Left bracket not on separate line")
+            body_sp.row == prev.start_point.row,
+            body_sp,
+            "ERROR",
+            "Left bracket not on separate line"
         )
         
         self.__check_body(indent + 2, body)
 
     def __check_indents_switch_statement(self, indent: int, node: Node) -> None:
 
-        body: Node | None = node.child_by_field_name("body")
+        fields = self.child_fields(node)
         
-        if body is None:
+        if "body" not in fields:
             return
 
-        if body.prev_sibling is None:
+        body, prev = fields["body"]
+
+        if prev is None:
             return
 
+        body_sp: Point = body.start_point
+
         # Open braket should be on separate line
         self.style_assert(
-            body.start_point.row == body.prev_sibling.start_point.row,
-            self.error(body.start_point, "Left bracket not on separate line")
+            body_sp.row == prev.start_point.row,
+            body_sp,
+            "ERROR",
+            "Left bracket not on separate line"
         )
 
         # Open braket should be indented by two whitespaces
         self.style_assert(
-            body.start_point.column != indent + 2,
-            self.error(
-                body.start_point,
-                f"Wrong indentation [Expected: {indent + 2} / Actual: {body.start_point.column}]"
-            )
+            body_sp.column != indent + 2,
+            body_sp,
+            "ERROR",
+            "Wrong indentation [Expected: {} / Actual: {}]",
+            indent + 2,
+            body_sp.column
         )
 
-        case_statements = ( n for n in body.named_children if n.type == "case_statement" )
+        # Single forward pass, remember the last two children
+        penult: Node | None = None
+        last: Node | None = None
+        case_statements: list[Node] = []
+
+        for child in self.walk_children(body):
+            penult, last = last, child
+            if child.type == "case_statement":
+                case_statements.append(child)
+
         for n in case_statements:
             self.__check_indents_case_statement(indent + 4, n)
 
+        if penult is None or last is None:
+            return
+
+        last_sp: Point = last.start_point
+
         # Close braket should be on separate line
         self.style_assert(
-            body.children[-1].start_point.row == body.children[-2].start_point.row,
-            self.error(body.start_point, "Left bracket not on separate line")
+            last_sp.row == penult.start_point.row,
+            body_sp,
+            "ERROR",
+            "Left bracket not on separate line"
         )
 
         # Close braket should be indented by two whitespaces
         self.style_assert(
-            body.children[-1].start_point.column != indent + 2,
-            self.error(
-                body.children[-1].start_point,
-                f"Wrong indentation [Expected: {indent + 2} / Actual: {body.children[-1].start_point.column}]"
-            )
+            last_sp.column != indent + 2,
+            last_sp,
+            "ERROR",
+            "Wrong indentation [Expected: {} / Actual: {}]",
+            indent + 2,
+            last_sp.column
         )
 
     def __check_indents_case_statement(self, indent: int, node: Node) -> None:
 
-        kw: Node = node.children[0]
-        offset: int = 3 if kw.type == "case" else 2
-        body: Node = node.children[offset]
+        # Single forward pass, the statements start after "case <value> :"
+        # or "default :", remember the node preceding the first one
+        offset: int = 2
+        prev: Node | None = None
+        body: Node | None = None
+        statements: list[Node] = []
+
+        for i, child in enumerate(self.walk_children(node)):
+            if i == 0 and child.type == "case":
+                offset = 3
+
+            if i < offset:
+                prev = child
+            elif body is None:
+                body = child
+                statements.append(child)
+            elif child.type in self._INDENT_CHECKED:
+                statements.append(child)
+
+        sp: Point = node.start_point
 
         self.style_assert(
-            node.start_point.column != indent,
-            self.error(
-                node.start_point,
-                f"Wrong indentation [Expected: {indent} / Actual: {node.start_point.column}]"
-            )
+            sp.column != indent,
+            sp,
+            "ERROR",
+            "Wrong indentation [Expected: {} / Actual: {}]",
+            indent,
+            sp.column
         )
 
+        # Empty case, falls through to the next one
+        if body is None or prev is None:
+            return
+
         if body.type == "compound_statement":
             
-            if body.prev_sibling is None:
-                return
-            
+            body_sp: Point = body.start_point
+
             # Open braket should be on separate line
             self.style_assert(
-                body.start_point.row == body.prev_sibling.start_point.row,
-                self.error(body.start_point, "Left bracket not on separate line")
+                body_sp.row == prev.start_point.row,
+                body_sp,
+                "ERROR",
+                "Left bracket not on separate line"
             )
             
             self.__check_body(indent + 2, body)
 
         else:
-            for n in node.children[offset:]:
-                self.__check_indents(indent + 2, n)
+            for n in statements:
+                if n.type in self._INDENT_CHECKED:
+                    self.__check_indents(indent + 2, n)
+
+    # Node types that increase the indent depth and their deferred checks
+    _INDENT_DISPATCH = {
+        "if_statement": __check_indents_if_statement,
+        "else_clause": __check_indents_if_statement,
+        "for_statement": __check_indents_for_statement,
+        "while_statement": __check_indents_while_statement,
+        "do_statement": __check_indents_while_statement,
+        "switch_statement": __check_indents_switch_statement,
+    }
+
+    # Every node type __check_indents acts on, anything else returns
+    # right away, so callers skip those children instead of recursing
+    _INDENT_CHECKED: frozenset[str] = frozenset(_INDENT_DISPATCH) | _INDENT_RECURSE
 
     def __check_whitespaces(self, node: Node) -> None:
         
         if node.text is not None:
-            node_text: str = node.text.decode()
+            node_text: bytes = node.text
         else:
             return
 
-        self.style_assert(
-            bool(re.search(r"\(\s+", node_text)),
-            self.error(node.start_point, "Whitespace after open paranthesis")
-        )
-
-        self.style_assert(
-            bool(re.search(r"\s+\)", node_text)),
-            self.error(node.start_point, "Whitespace before close paranthesis")
-        )
-
-        self.style_assert(
-            bool(
-                re.search(r"(?<!\s)(\|\||&&|<<=|>>=|[+\*\/%&|^<>!=]=)", node_text)
-            ),
-            self.error(node.start_point, "Missing whitespaces before operator")
-        )
+        # Blank out string contents, keeping their length so that offsets
+        # still point into the source and the quotes keep paranthesis
+        # and operators around them separated.
+        # Most nodes hold no string at all, skip the extra pass for them
+        if b'"' in node_text:
+            node_text = _RE_STRIP_STR.sub(_blank_string, node_text)
+
+        # Single scan over the text, each rule is reported once per node,
+        # at the offset of its first violation
+        found: dict[str, int] = {}
+
+        for m in _RE_WS_ALL.finditer(node_text):
+            if m.lastgroup == "op":
+                start, end = m.span()
+                if start == 0 or not node_text[start - 1:start].isspace():
+                    found.setdefault("op_before", start)
+                if end == len(node_text) or not node_text[end:end + 1].isspace():
+                    found.setdefault("op_after", end)
+            elif m.lastgroup is not None:
+                found.setdefault(m.lastgroup, m.start())
+
+            if len(found) == len(_WS_RULES):
+                break
 
-        self.style_assert(
-            bool(
-                re.search(r"(\|\||&&|<<=|>>=|[+\*\/%&|^<>!=]=)(?!\s)", node_text)
-            ),
-            self.error(node.start_point, "Missing whitespaces after operator")
-        )
+        base: int = node.start_byte
 
-        self.style_assert(
-            bool(
-                re.search(r",(?!\s)", re.sub(r"([\"\'].*?\")", "", node_text))
-            ),
-            self.error(node.start_point, "Missing whitespaces after comma")
-        )
+        for rule, text in _WS_RULES:
+            if rule in found:
+                self.style_assert(
+                    True,
+                    self._point_at(base + found[rule]),
+                    "ERROR",
+                    text
+                )
         
     def __check_structs(self, node: Node):
         
-        name: Node | None = node.child_by_field_name("name")
-        body: Node | None = node.child_by_field_name("body")
-        indent: int = node.start_point.column
+        fields = self.child_fields(node)
+        sp: Point = node.start_point
+        indent: int = sp.column
             
-        if body is None or body.prev_sibling is None:
+        if "body" not in fields:
             return
+
+        body, prev = fields["body"]
+
+        if prev is None:
+            return
+
+        name: Node | None = fields["name"][0] if "name" in fields else None
         
         if name is None:
             self.style_assert(
                 True,
-                self.error(node.start_point, "Avoid anonymous structs")
+                sp,
+                "ERROR",
+                "Avoid anonymous structs"
             )
         else:
             self.style_assert(
-                not bool(re.search(r".*_s$", name.text.decode())),
-                self.error(node.start_point, "Struct name should end in \"_s\"")
+                not name.text.endswith(b"_s"),
+                sp,
+                "ERROR",
+                "Struct name should end in \"_s\""
             )
 
+        body_sp: Point = body.start_point
+
         # Open braket should be on separate line
         self.style_assert(
-            body.start_point.row == body.prev_sibling.start_point.row,
-            self.error(body.start_point, "Left bracket not on separate line")
+            body_sp.row == prev.start_point.row,
+            body_sp,
+            "ERROR",
+            "Left bracket not on separate line"
         )
         
         self.__check_body(indent, body)
         
     def __check_enums(self, node: Node):
         
-        name: Node | None = node.child_by_field_name("name")
-        body: Node | None = node.child_by_field_name("body")
-        indent: int = node.start_point.column
+        fields = self.child_fields(node)
+        sp: Point = node.start_point
+        indent: int = sp.column
             
-        if body is None or body.prev_sibling is None:
+        if "body" not in fields:
             return
+
+        body, prev = fields["body"]
+
+        if prev is None:
+            return
+
+        name: Node | None = fields["name"][0] if "name" in fields else None
         
         if name is None:
             self.style_assert(
                 True,
-                self.error(node.start_point, "Avoid anonymous enums")
+                sp,
+                "ERROR",
+                "Avoid anonymous enums"
             )
         else:
             self.style_assert(
-                not bool(re.search(r".*_e$", name.text.decode())),
-                self.error(node.start_point, "Struct name should end in \"_e\"")
+                not name.text.endswith(b"_e"),
+                sp,
+                "ERROR",
+                "Struct name should end in \"_e\""
             )
 
+        body_sp: Point = body.start_point
+
         # Open braket should be on separate line
         self.style_assert(
-            body.start_point.row == body.prev_sibling.start_point.row,
-            self.error(body.start_point, "Left bracket not on separate line")
+            body_sp.row == prev.start_point.row,
+            body_sp,
+            "ERROR",
+            "Left bracket not on separate line"
         )
         
         self.__check_body(indent, body)
 
     def __check_pointer_declarator(self, node: Node) -> None:
 
+        if node.text is not None:
+            text: bytes = node.text
+        else:
+            return
+
+        sp: Point = node.start_point
+
         if self.nuttx_codebase is True:
             self.style_assert(
-                not bool(re.search(r"(FAR|NEAR|DSEG|CODE)", node.text.decode())),
-                self.error(node.start_point, "Pointer qualifier missing")
+                not self._has_far_quals or not any(q in text for q in _QUALS),
+                sp,
+                "ERROR",
+                "Pointer qualifier missing"
             )
 
         self.style_assert(
-            bool(re.search(r"(?<!\s)\*", node.text.decode())),
-            self.error(node.start_point, "Missing whitespace before pointer")
+            bool(_RE_PTR_NOWS.search(text)),
+            sp,
+            "ERROR",
+            "Missing whitespace before pointer"
         )
 
-
-
+    # Query capture names and the check run for each captured node, in order
+    _CAPTURE_HANDLERS = (
+        ("function.body", __check_function_body),
+        ("expression.paranthesis", __check_paranthesis),
+        ("list.arguments", __check_whitespaces),
+        ("structs", __check_structs),
+        ("enums", __check_enums),
+        ("declarator.pointer", __check_pointer_declarator),
+    )